@@ -13,7 +13,9 @@ CONF_COMMUNITY: Final = "community"
 # CONF_WRITE_COMMUNITY: Final = "write community"
 CONF_POLLING_INTERVAL: Final = "polling interval(seconds)"
 
-MIB_SOURCE_DIR: Final = f"./custom_components/{DOMAIN}/mibs"
+# Max OIDs per SNMP GET request. Agents commonly cap requests at 64-100 varbinds and time out
+# beyond that; batches of 32 also keep each UDP datagram comfortably under the MTU.
+OID_BATCH_SIZE: Final = 32
 
 # PLATFORMS = [Platform.SENSOR, Platform.SWITCH]
 PLATFORMS = [Platform.SENSOR]
@@ -3,96 +3,138 @@ import time
 from .snmp import SNMPManager
 from .const import _LOGGER
 
+# Seconds-to-hours factor for the energy integration; multiplying is cheaper than dividing
+_INV_3600 = 1.0 / 3600.0
+
+# The OIDs below are fixed constants from SNMPv2-MIB and PDU-MIB. Hard-coding the numeric
+# form skips pysnmp's symbolic name resolution and removes MIB loading from the runtime
+# entirely; the ASN.1 sources stay in mibs/ as the reference for these values.
+SYS_DESCR_OID = (1, 3, 6, 1, 2, 1, 1, 1, 0)
+SYS_NAME_OID = (1, 3, 6, 1, 2, 1, 1, 5, 0)
+OUTLET_ENERGY_SUPPORT_OID = (1, 3, 6, 1, 4, 1, 13742, 4, 1, 1, 32, 0)
+OUTLET_COUNT_OID = (1, 3, 6, 1, 4, 1, 13742, 4, 1, 2, 1, 0)
+UNIT_CPU_TEMP_OID = (1, 3, 6, 1, 4, 1, 13742, 4, 1, 3, 1, 5, 0)
+
+# PDU-MIB outletTable entry: 1.3.6.1.4.1.13742.4.1.2.2.1.<column>
+_OUTLET_ENTRY_OID = (1, 3, 6, 1, 4, 1, 13742, 4, 1, 2, 2, 1)
+
+# The slow-moving identity scalars, refreshed together on the SCALAR_REFRESH_SECONDS TTL
+IDENTITY_SCALAR_OIDS = (SYS_DESCR_OID, SYS_NAME_OID, OUTLET_ENERGY_SUPPORT_OID, OUTLET_COUNT_OID)
+
+# How often to re-fetch the scalars that essentially never change (sysDescr, sysName,
+# outletEnergySupport, outletCount). Everything else stays on the normal poll cycle.
+SCALAR_REFRESH_SECONDS = 3600
+
+# An outlet reading 0 W for this many consecutive polls is considered idle and drops out of
+# the per-cycle fetch; idle outlets are only refreshed every IDLE_POLL_CYCLES cycles, which
+# keeps the request size proportional to the outlets actually doing something.
+IDLE_AFTER_CYCLES = 4
+IDLE_POLL_CYCLES = 5
+
 
 class RaritanPDUOutlet:
-    def __init__(self, snmp_manager: SNMPManager, index: int, energy_support: bool):
-        self.snmp_manager: SNMPManager = snmp_manager
-        self.index = index
-        self.energy_support = energy_support
+    # Ignore some data for performance optimization
+    SENSOR_KEYS = (
+        "label",
+
+        # A value for each outlet which describes the operational state of the outlet. It is also used to set the operational state of the outlet Enumeration: 'on': 1, 'cycling': 2, 'off': 0, 'error': -1.
+        # "operational_state",
 
-        # Ignore some data for performance optimization
-        self.sensor_data = {
-            "label": "",
+        # A unique value for the current sensor attached to the outlet. This value is reported in milliamps (1/1000th of an amp)
+        "current",
 
-            # A value for each outlet which describes the operational state of the outlet. It is also used to set the operational state of the outlet Enumeration: 'on': 1, 'cycling': 2, 'off': 0, 'error': -1.
-            # "operational_state": 0,
+        # A unique value for the max. current sensor attached to the outlet. This value is reported in milliamps (1/1000th of an amp)
+        # "max_current",
 
-            # A unique value for the current sensor attached to the outlet. This value is reported in milliamps (1/1000th of an amp)
-            "current": 0,
+        # A unique value for the voltage sensor attached to the outlet.This value is reported in millivolts (1/1000th of a volt)
+        "voltage",
 
-            # A unique value for the max. current sensor attached to the outlet. This value is reported in milliamps (1/1000th of an amp)
-            # "max_current": 0,
+        # A unique value for the active power sensor attached to the outlet. This value is reported in Watts. The real power consumption.
+        "active_power",
 
-            # A unique value for the voltage sensor attached to the outlet.This value is reported in millivolts (1/1000th of a volt)
-            "voltage": 0,
+        # A unique value for the apparent power sensor attached to the outlet. This value is reported in Volt-Amps. This is the product of current and voltage.
+        # "apparent_power",
 
-            # A unique value for the active power sensor attached to the outlet. This value is reported in Watts. The real power consumption.
-            "active_power": 0,
+        # A unique value for the power factor of the outlet. The reading represents a percentage in the range of 0% to 100%. The power factor, a ratio of real power to apparent power.
+        "power_factor",
 
-            # A unique value for the apparent power sensor attached to the outlet. This value is reported in Volt-Amps. This is the product of current and voltage.
-            # "apparent_power": 0,
+        # The value of the upper warning (non-critical) current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
+        # "current_upper_warning",
 
-            # A unique value for the power factor of the outlet. The reading represents a percentage in the range of 0% to 100%. The power factor, a ratio of real power to apparent power.
-            "power_factor": 0,
+        # The value of the upper critical current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
+        # "current_upper_critical",
 
-            # The value of the upper warning (non-critical) current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
-            # "current_upper_warning": 0,
+        # The value of the lower warning (non-critical) current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
+        # "current_lower_warning",
 
-            # The value of the upper critical current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
-            # "current_upper_critical": 0,
+        # The value of the lower critical current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
+        # "current_lower_critical",
 
-            # The value of the lower warning (non-critical) current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
-            # "current_lower_warning": 0,
+        # The hysteresis used for deassertions. This value is reported in milliamps (1/1000th of an amp)
+        # "current_hysteresis",
 
-            # The value of the lower critical current threshold for the outlet. This value is reported in milliamps (1/1000th of an amp)
-            # "current_lower_critical": 0,
+        # The current rating of the outlet. This value is reported in milliamps (1/1000th of an amp). The rated maximum current that the system can safely handle, in milliamps
+        # "current_rating",
+    )
 
-            # The hysteresis used for deassertions. This value is reported in milliamps (1/1000th of an amp)
-            # "current_hysteresis": 0,
+    # NOT SUPPORTED by all PDUs. watt_hours is the value of the cumulative active energy for this outlet. This value is reported in WattHours. The total energy consumption in watt-hours (accumulated over time)
+    SENSOR_KEYS_WITH_ENERGY = SENSOR_KEYS + ("watt_hours",)
 
-            # The current rating of the outlet. This value is reported in milliamps (1/1000th of an amp). The rated maximum current that the system can safely handle, in milliamps
-            # "current_rating": 0,
+    # Precomputed key -> numeric outletTable column OID (e.g. "active_power" ->
+    # outletActivePower, column 7), keeping symbol resolution out of the polling path
+    SENSOR_COLUMN_OIDS = {
+        "label": _OUTLET_ENTRY_OID + (2,),  # outletLabel
+        "current": _OUTLET_ENTRY_OID + (4,),  # outletCurrent
+        "voltage": _OUTLET_ENTRY_OID + (6,),  # outletVoltage
+        "active_power": _OUTLET_ENTRY_OID + (7,),  # outletActivePower
+        "power_factor": _OUTLET_ENTRY_OID + (9,),  # outletPowerFactor
+        "watt_hours": _OUTLET_ENTRY_OID + (31,),  # outletWattHours
+    }
 
-            # NOT SUPPORTED by all PDUs. The value of the cumulative active energy for this outlet. This value is reported in WattHours. The total energy consumption in watt-hours (accumulated over time)
-            # "watt_hours": 0,
-        }
+    def __init__(self, snmp_manager: SNMPManager, index: int, energy_support: bool):
+        self.snmp_manager: SNMPManager = snmp_manager
+        self.index = index
+        self.energy_support = energy_support
+
+        self.sensor_keys = self.SENSOR_KEYS_WITH_ENERGY if energy_support else self.SENSOR_KEYS
+        self.sensor_data = {key: "" if key == "label" else 0 for key in self.sensor_keys}
+        # Seed the derived total so entities can read it even if the first poll fails
+        self.sensor_data["energy_delivered"] = 0
         self.last_sensor_data_update_timestamp = 0
 
         self.initial_energy_delivered = 0  # energy delivered from previous sessions
         self.energy_delivered = 0  # energy delivered in current session
 
-        if energy_support:
-            self.sensor_data["watt_hours"] = 0
+        self.idle_cycles = 0  # consecutive polls with 0 W active power
+
+    def is_idle(self) -> bool:
+        return self.idle_cycles >= IDLE_AFTER_CYCLES
 
     def initialize_energy_delivered(self, initial_value: float):
         self.initial_energy_delivered = initial_value
-        _LOGGER.debug(f"Initialize Outlet {self.index} initial_energy_delivered to {self.initial_energy_delivered}")
+        # Refresh the exposed total right away so the restored value shows before the next poll
+        self.sensor_data["energy_delivered"] = self.energy_delivered + self.initial_energy_delivered
+        _LOGGER.debug("Initialize Outlet %s initial_energy_delivered to %s", self.index, self.initial_energy_delivered)
 
     def update_energy_delivered(self, current_sensor_data_update_timestamp):
-        # not enough data to estimate
-        if self.last_sensor_data_update_timestamp == 0:
-            return  # abort
-
-        time_diff_seconds = current_sensor_data_update_timestamp - self.last_sensor_data_update_timestamp
-        if time_diff_seconds < 0:
-            return  # abort
+        # not enough data to estimate on the very first poll
+        if self.last_sensor_data_update_timestamp != 0:
+            # Timestamps come from time.monotonic(), so the difference can never be negative
+            time_diff_hours = (current_sensor_data_update_timestamp - self.last_sensor_data_update_timestamp) * _INV_3600
+            new_energy_delivered = self.sensor_data["active_power"] * time_diff_hours
+            self.energy_delivered += new_energy_delivered
 
-        time_diff_hours = time_diff_seconds / (60.0 * 60.0)
-        new_energy_delivered = self.sensor_data["active_power"] * time_diff_hours
-        self.energy_delivered += new_energy_delivered
+        # Refresh the exposed total in place; get_data hands out this same dict
+        self.sensor_data["energy_delivered"] = self.energy_delivered + self.initial_energy_delivered
 
     def update_last_sensor_data_update_timestamp(self, current_sensor_data_update_timestamp):
         self.last_sensor_data_update_timestamp = current_sensor_data_update_timestamp
 
     def get_data(self):
-        data = self.sensor_data.copy()
-        _LOGGER.debug(f"Retried sensor data from Outlet {self.index} {str(data)}")
-
-        data["energy_delivered"] = self.energy_delivered + self.initial_energy_delivered
-        _LOGGER.debug(
-            f"Retried energy data from Outlet energy_delivered: {self.energy_delivered} initial_energy_delivered:{self.initial_energy_delivered}")
-
-        return data
+        # Hand back the dict that update_data mutates in place rather than copying it for
+        # every entity scrape; callers treat it as read-only
+        _LOGGER.debug("Retried sensor data from Outlet %s %s", self.index, self.sensor_data)
+        return self.sensor_data
 
 
 class RaritanPDU:
@@ -106,10 +148,20 @@ class RaritanPDU:
         self.cpu_temperature = 0
         self.outlets: [RaritanPDUOutlet] = []
 
+        # Numeric OIDs resolved from the MIB once per outlet layout, so polling does not
+        # re-resolve the symbolic names every cycle
+        self.sensor_names: [str] = []
+        self.sensor_column_oids: [tuple] = []
+        self.cpu_temp_oid: tuple = None
+
+        self._last_scalar_fetch = 0.0  # monotonic time of the last slow-scalar refresh
+        self._poll_cycle = 0  # counts sensor polls for the idle-outlet refresh schedule
+        self._data = {}  # reused by get_data so scrapes don't allocate a fresh dict
+
     async def authenticate(self) -> bool:
         """Test if we can authenticate with the host."""
         try:
-            result = await self.snmp_manager.snmp_get(["SNMPv2-MIB", "sysDescr", 0])
+            result = await self.snmp_manager.snmp_get(SYS_DESCR_OID)
             if result is None:
                 return False
             return str(result).startswith("Raritan Dominion PX")
@@ -119,62 +171,172 @@ class RaritanPDU:
     async def update_data(self):
         _LOGGER.info("Initializing RaritanPDU")
 
-        result = await self.snmp_manager.snmp_get(
-            ["SNMPv2-MIB", "sysDescr", 0],
-            ["SNMPv2-MIB", "sysName", 0],
-            ["PDU-MIB", "outletEnergySupport", 0],
-            ["PDU-MIB", "outletCount", 0],
-            ["PDU-MIB", "unitCpuTemp", 0],  # The value for the unit's CPU temperature sensor in tenth degrees celsius.
-        )
-
+        # On the first update the outlet layout is unknown, so the identity scalars must land
+        # alone before a sensor request can be sized. Afterwards each poll is a single
+        # request: when the identity TTL is due, those scalars simply ride along as extra
+        # non-repeaters in the same PDU as the sensor columns.
+        if not self.outlets:
+            await self._fetch_scalars()
+        await self._fetch_outlet_sensors()
+
+    def _identity_refresh_due(self) -> bool:
+        # The identity scalars change essentially never, so only re-fetch them on a long TTL.
+        # cpu_temperature and the outlet sensors stay on the normal poll cycle.
+        return self._last_scalar_fetch == 0 or time.monotonic() - self._last_scalar_fetch > SCALAR_REFRESH_SECONDS
+
+    async def _fetch_scalars(self):
+        result = await self.snmp_manager.snmp_get(*IDENTITY_SCALAR_OIDS)
         if result is None:
             return  # abort update
+        self._apply_identity_scalars(result)
 
-        [desc, name, energy_support, outlet_count, cpu_temperature] = result
+    def _apply_identity_scalars(self, values):
+        [desc, name, energy_support, outlet_count] = values
 
         self.name = str(desc).split(" - ")[0] + " " + str(name)
         self.energy_support = energy_support == "Yes"
-        self.cpu_temperature = cpu_temperature / 10.0  # The value for the unit's CPU temperature sensor in tenth degrees celsius.
+        self._last_scalar_fetch = time.monotonic()
 
         # If the outlet count has changed, reinitialize the outlets list. This will run when first initialized.
         if outlet_count != self.outlet_count:
             self.outlet_count = outlet_count
             self.outlets = []
+            self._data.clear()  # drop entries for outlets that may no longer exist
             for i in range(outlet_count):
                 # Create an outlet (index starts from 1) and append it to the outlets list
                 outlet = RaritanPDUOutlet(self.snmp_manager, i + 1, self.energy_support)
                 self.outlets.append(outlet)
 
-        # For each outlet, append all relevant MIB OIDs (using the key names from outlet.data)
-        oids = []
-        for outlet in self.outlets:
-            for data_name in outlet.sensor_data.keys():
-                mib_object_name = f"outlet{data_name.title().replace('_', '')}"
-                oids.append(["PDU-MIB", mib_object_name, outlet.index])
+            # One column OID per sensor (using the key names from outlet.sensor_data); GETBULK
+            # walks each column across all outlets, which is far fewer PDUs than one OID per
+            # (outlet, sensor) pair.
+            self.sensor_names = RaritanPDUOutlet.SENSOR_KEYS_WITH_ENERGY if self.energy_support \
+                else RaritanPDUOutlet.SENSOR_KEYS
+            self.sensor_column_oids = [
+                RaritanPDUOutlet.SENSOR_COLUMN_OIDS[data_name] for data_name in self.sensor_names
+            ]
+            self.cpu_temp_oid = UNIT_CPU_TEMP_OID
+
+    async def _fetch_outlet_sensors(self):
+        if not self.outlets:
+            return  # nothing to poll until the scalars have established the outlet layout
+
+        # Poll only the active outlets most cycles; every IDLE_POLL_CYCLES cycle (and whenever
+        # no outlet is idle) fall back to the full-table GETBULK so idle outlets still refresh
+        # and get a chance to rejoin the active set.
+        self._poll_cycle += 1
+        active_outlets = [outlet for outlet in self.outlets if not outlet.is_idle()]
+        if len(active_outlets) < len(self.outlets) and self._poll_cycle % IDLE_POLL_CYCLES != 0:
+            await self._fetch_active_outlets(active_outlets)
+        else:
+            await self._fetch_all_outlets()
+
+    async def _fetch_all_outlets(self):
+        # Fetch all the outlet data in one go, with the CPU temperature (and the identity
+        # scalars, when their TTL is due) as scalar non-repeaters in the same PDU. Full
+        # instance OIDs are safe to pass: snmp_bulk_get compensates for GETBULK's GETNEXT
+        # semantics and validates the returned instances, aborting the cycle on a mismatch —
+        # the TTL then stays due and the scalars simply retry with the next poll.
+        identity_due = self._identity_refresh_due()
+        non_repeater_oids = [self.cpu_temp_oid]
+        if identity_due:
+            non_repeater_oids.extend(IDENTITY_SCALAR_OIDS)
+
+        results = await self.snmp_manager.snmp_bulk_get(
+            non_repeater_oids, self.sensor_column_oids, self.outlet_count
+        )
+        current_update_time = time.monotonic()
+        if results is None:
+            return  # abort update
+
+        scalars, columns = results
+
+        # snmp_bulk_get only returns values whose OIDs match their requested column, so a
+        # truncated or past-table-end walk surfaces here as a short column rather than as
+        # misassigned values. Skip the whole cycle in that case so stale active_power never
+        # feeds the energy accumulation and initial_energy_delivered stays authoritative.
+        if len(scalars) != len(non_repeater_oids) or len(columns) != len(self.sensor_names) \
+                or any(len(column) != self.outlet_count for column in columns):
+            _LOGGER.error("Outlet sensor fetch returned a truncated table (%s columns, expected %s x %s rows)",
+                          len(columns), len(self.sensor_names), self.outlet_count)
+            return  # abort update
+
+        self.cpu_temperature = scalars[0] / 10.0  # The value for the unit's CPU temperature sensor in tenth degrees celsius.
+
+        # Update outlet data with the fetched columns
+        for data_name, column in zip(self.sensor_names, columns):
+            for outlet, value in zip(self.outlets, column):
+                outlet.sensor_data[data_name] = value
+
+        self._finish_outlet_update(self.outlets, current_update_time)
+
+        # Apply last: an outlet-count change rebuilds the outlet list, which must not happen
+        # while this cycle's columns are being assigned
+        if identity_due:
+            self._apply_identity_scalars(scalars[1:])
+
+    async def _fetch_active_outlets(self, outlets: ["RaritanPDUOutlet"]):
+        # Request just the given outlets' instance OIDs; with a handful of active outlets this
+        # is far smaller than walking the full table. The scalars share the same request.
+        identity_due = self._identity_refresh_due()
+        scalar_oids = [self.cpu_temp_oid]
+        if identity_due:
+            scalar_oids.extend(IDENTITY_SCALAR_OIDS)
+
+        oids = list(scalar_oids)
+        for data_name in self.sensor_names:
+            column_oid = RaritanPDUOutlet.SENSOR_COLUMN_OIDS[data_name]
+            for outlet in outlets:
+                oids.append(column_oid + (outlet.index,))
 
-        # Fetch all the outlet data in one go using the OIDs
         results = await self.snmp_manager.snmp_get(*oids)
-        current_update_time = time.time()
-        if result is None:
+        current_update_time = time.monotonic()
+        if results is None:
             return  # abort update
 
-        # Update outlet data with the fetched results
-        i = 0
-        for outlet in self.outlets:
-            for data_name in outlet.sensor_data.keys():
-                # Update each data field in the outlet using the corresponding result
+        if len(oids) == 1:
+            results = [results]  # snmp_get unwraps single-OID requests
+
+        # Same stale-data hazard as the bulk path: only consume a complete response
+        if len(results) != len(oids):
+            _LOGGER.error("Outlet sensor fetch returned %s values, expected %s", len(results), len(oids))
+            return  # abort update
+
+        self.cpu_temperature = results[0] / 10.0  # The value for the unit's CPU temperature sensor in tenth degrees celsius.
+
+        i = len(scalar_oids)
+        for data_name in self.sensor_names:
+            for outlet in outlets:
                 outlet.sensor_data[data_name] = results[i]
                 i += 1
 
+        self._finish_outlet_update(outlets, current_update_time)
+
+        # Apply last: an outlet-count change rebuilds the outlet list, which must not happen
+        # while this cycle's results are being assigned
+        if identity_due:
+            self._apply_identity_scalars(results[1:len(scalar_oids)])
+
+    @staticmethod
+    def _finish_outlet_update(outlets: ["RaritanPDUOutlet"], current_update_time: float):
+        for outlet in outlets:
             # Calculate energy first, then update timestamp
             outlet.update_energy_delivered(current_update_time)
             outlet.update_last_sensor_data_update_timestamp(current_update_time)
 
+            # Track idleness for the adaptive poll partitioning
+            if outlet.sensor_data["active_power"] == 0:
+                outlet.idle_cycles += 1
+            else:
+                outlet.idle_cycles = 0
+
     def get_outlet_by_index(self, index: int) -> RaritanPDUOutlet:
         return self.outlets[index - 1]  # Outlet index starts from 1
 
     def get_data(self) -> dict:
-        data = {}
+        # The per-outlet dicts are stable objects mutated in place, so rebuilding this
+        # mapping costs nothing beyond pointer writes and it never reallocates
+        data = self._data
         # Add data from outlets
         for outlet in self.outlets:
             data[outlet.index] = outlet.get_data()
@@ -1,11 +1,43 @@
 import asyncio
-import os
-from pathlib import Path
 from pysnmp.entity.engine import SnmpEngine
-from pysnmp.hlapi.v3arch import get_cmd, CommunityData, UdpTransportTarget, ContextData, ObjectIdentity, ObjectType
-from pysnmp.smi import builder, view, compiler
+from pysnmp.hlapi.v3arch import get_cmd, bulk_cmd, CommunityData, UdpTransportTarget, ContextData, ObjectIdentity, \
+    ObjectType
+from pysnmp.proto.rfc1902 import OctetString
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
 
-from .const import _LOGGER, MIB_SOURCE_DIR
+from .const import _LOGGER, OID_BATCH_SIZE
+
+# Cap on GETBULK max-repetitions per request. Larger values pack more rows per PDU but risk
+# overrunning the agent's response size limit, so stay in the commonly safe 25-50 range.
+MAX_BULK_REPETITIONS = 25
+
+
+def _chunked(oids, n=OID_BATCH_SIZE):
+    """Split oids into batches of at most n."""
+    return [oids[i:i + n] for i in range(0, len(oids), n)]
+
+
+# One SnmpEngine (and thus one UDP socket) shared by every configured PDU; pysnmp
+# multiplexes concurrent requests over it, so per-device engines and their sockets are
+# unnecessary. Created lazily because the constructor does blocking I/O.
+_shared_engine = None
+_shared_engine_lock = asyncio.Lock()
+
+# Cap on concurrent in-flight SNMP requests across all PDUs, so a burst of gathered
+# batches cannot exhaust a firewall's session table
+MAX_IN_FLIGHT_REQUESTS = 10
+_request_semaphore = asyncio.Semaphore(MAX_IN_FLIGHT_REQUESTS)
+
+
+async def _get_shared_engine() -> SnmpEngine:
+    global _shared_engine
+    if _shared_engine is None:
+        async with _shared_engine_lock:
+            if _shared_engine is None:
+                # https://developers.home-assistant.io/docs/asyncio_blocking_operations
+                loop = asyncio.get_event_loop()
+                _shared_engine = await loop.run_in_executor(None, SnmpEngine)
+    return _shared_engine
 
 
 class SNMPManager:
@@ -15,47 +47,60 @@ class SNMPManager:
         self.port = port
         self.community = community
 
-        self.modules_loaded = False
-        self.snmp_engine = None
-
-    def load_mib_modules(self):
-        if self.modules_loaded:
-            return
-
-        if not Path(MIB_SOURCE_DIR).is_dir():
-            _LOGGER.error(f"mibs directory does not exist: {MIB_SOURCE_DIR}, cwd: {os.getcwd()}")
-
-        mibBuilder = builder.MibBuilder()
-        mibBuilder.add_mib_sources(builder.DirMibSource(MIB_SOURCE_DIR))
-        compiler.add_mib_compiler(mibBuilder, sources=[MIB_SOURCE_DIR])
-        mibBuilder.loadModules('PDU-MIB', 'SNMPv2-SMI', 'INET-ADDRESS-MIB', 'SNMPv2-TC', 'SNMPv2-CONF', 'SNMPv2-MIB')
-        mibViewController = view.MibViewController(mibBuilder)
-        self.modules_loaded = True
+        # Auth/context objects are immutable per manager, build them once instead of per call
+        self.community_data = CommunityData(community)
+        self.context_data = ContextData()
+
+        # UDP transport is created once on first use and reused for every request, so each
+        # poll does not pay socket setup/teardown
+        self._transport = None
+        self._transport_lock = asyncio.Lock()
+
+    async def _get_transport(self) -> UdpTransportTarget:
+        if self._transport is None:
+            async with self._transport_lock:
+                if self._transport is None:
+                    self._transport = await UdpTransportTarget.create(
+                        (self.host, self.port), timeout=5, retries=1
+                    )
+        return self._transport
+
+    @staticmethod
+    def _to_object_type(oid) -> ObjectType:
+        # Numeric OID tuples skip the symbolic MIB lookup entirely; symbolic specs are still
+        # accepted for names the engine's built-in core MIBs can resolve
+        if isinstance(oid[0], int):
+            return ObjectType(ObjectIdentity(oid))
+        return ObjectType(ObjectIdentity(*oid))
 
     async def snmp_get(self, *oids: any) -> any:
-        _LOGGER.debug(f"SNMP get: {self.host}:{self.port} {self.community} {oids}")
+        """Fetch oids in batches of at most OID_BATCH_SIZE, issued concurrently."""
+        results = await asyncio.gather(*(self._snmp_get_batch(*chunk) for chunk in _chunked(oids)))
+        if any(batch is None for batch in results):
+            return None
 
-        # https://developers.home-assistant.io/docs/asyncio_blocking_operations
-        loop = asyncio.get_event_loop()
+        results = [value for batch in results for value in batch]
+        if len(results) == 1:
+            return results[0]
+        return results
 
-        # load modules if not already
-        if not self.modules_loaded:
-            await loop.run_in_executor(None, self.load_mib_modules)
+    async def _snmp_get_batch(self, *oids: any) -> any:
+        _LOGGER.debug("SNMP get: %s:%s %s %s", self.host, self.port, self.community, oids)
 
-        if self.snmp_engine is None:
-            self.snmp_engine = await loop.run_in_executor(None, SnmpEngine)
+        snmp_engine = await _get_shared_engine()
 
-        oid_objects = [ObjectType(ObjectIdentity(*oid)) for oid in oids]
-        errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
-            self.snmp_engine,
-            CommunityData(self.community),
-            await UdpTransportTarget.create((self.host, self.port), timeout=5, retries=1),
-            ContextData(),
-            *oid_objects
-        )
+        oid_objects = [self._to_object_type(oid) for oid in oids]
+        async with _request_semaphore:
+            errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
+                snmp_engine,
+                self.community_data,
+                await self._get_transport(),
+                self.context_data,
+                *oid_objects
+            )
 
-        _LOGGER.debug(f"SNMP get: {self.host}:{self.port} {self.community} {oids} "
-                      f"Error: {errorIndication}, Status: {errorStatus}, Index: {errorIndex}, VarBinds: {varBinds}")
+        _LOGGER.debug("SNMP get: %s:%s %s %s Error: %s, Status: %s, Index: %s, VarBinds: %s",
+                      self.host, self.port, self.community, oids, errorIndication, errorStatus, errorIndex, varBinds)
 
         if errorIndication:
             _LOGGER.error("SNMP error: %s", errorIndication)
@@ -69,16 +114,125 @@ class SNMPManager:
             )
             return None
 
-        results = []
-        for varBind in varBinds:
-            val = varBind.prettyPrint().split('=')[1].strip()
-            if val.isdigit():
-                results.append(int(val))
-            elif val.isdecimal():
-                results.append(float(val))
-            else:
-                results.append(val)
-
-        if len(results) == 1:
-            return results[0]
+        results = [self._parse_varbind(varBind) for varBind in varBinds]
+        if any(value is None for value in results):
+            _LOGGER.error("SNMP get returned missing instances: %s", varBinds)
+            return None
         return results
+
+    async def snmp_bulk_get(self, non_repeater_oids: list, column_oids: list, row_count: int) -> any:
+        """Fetch `row_count` rows of each table column with GETBULK, plus optional scalar non-repeaters.
+
+        Returns a (non_repeater_results, columns) tuple where `columns` holds one list of
+        `row_count` values per entry in `column_oids`, or None on SNMP error.
+        """
+        _LOGGER.debug("SNMP bulk get: %s:%s %s %s %s x%s",
+                      self.host, self.port, self.community, non_repeater_oids, column_oids, row_count)
+
+        snmp_engine = await _get_shared_engine()
+
+        # GETBULK applies GETNEXT semantics to non-repeaters (RFC 3416), so requesting a
+        # scalar's full instance OID would return its lexicographic successor. Request the
+        # parent node instead, so the walk lands on the instance itself, and verify below
+        # that it actually did.
+        non_repeater_objects = [
+            self._to_object_type(oid[:-1] if isinstance(oid[0], int) else oid) for oid in non_repeater_oids
+        ]
+        column_objects = [self._to_object_type(oid) for oid in column_oids]
+        non_repeater_results = []
+        columns = [[] for _ in column_oids]
+
+        while column_objects and min(len(column) for column in columns) < row_count:
+            max_repetitions = min(MAX_BULK_REPETITIONS, row_count - min(len(column) for column in columns))
+            async with _request_semaphore:
+                errorIndication, errorStatus, errorIndex, varBinds = await bulk_cmd(
+                    snmp_engine,
+                    self.community_data,
+                    await self._get_transport(),
+                    self.context_data,
+                    len(non_repeater_objects), max_repetitions,
+                    *non_repeater_objects, *column_objects
+                )
+
+            _LOGGER.debug("SNMP bulk get: %s:%s %s Error: %s, Status: %s, Index: %s, VarBinds: %s",
+                          self.host, self.port, self.community, errorIndication, errorStatus, errorIndex, varBinds)
+
+            if errorIndication:
+                _LOGGER.error("SNMP error: %s", errorIndication)
+                return None
+
+            if errorStatus:
+                _LOGGER.error(
+                    "%s at %s",
+                    errorStatus.prettyPrint(),
+                    errorIndex and varBinds[int(errorIndex) - 1] or "?"
+                )
+                return None
+
+            # Non-repeaters come back first and only need to be requested once. Each one
+            # must be the instance that was asked for; anything else means the agent does
+            # not have that scalar and the walk moved on to an unrelated object.
+            if non_repeater_objects:
+                scalar_binds = varBinds[:len(non_repeater_objects)]
+                for varBind, oid in zip(scalar_binds, non_repeater_oids):
+                    if isinstance(oid[0], int) and tuple(varBind[0].get_oid()) != tuple(oid):
+                        _LOGGER.error("SNMP bulk get returned %s instead of requested scalar %s",
+                                      varBind[0].get_oid(), oid)
+                        return None
+                non_repeater_results = [self._parse_varbind(varBind) for varBind in scalar_binds]
+                if any(value is None for value in non_repeater_results):
+                    _LOGGER.error("SNMP bulk get returned missing scalar instances: %s", scalar_binds)
+                    return None
+                varBinds = varBinds[len(non_repeater_objects):]
+                non_repeater_objects = []
+
+            # An agent may truncate the response mid-row to fit its message size limit
+            # (RFC 3416); only whole rows can be consumed, since a partial row would
+            # misalign the resumed walk and swap values between columns
+            varBinds = varBinds[:len(varBinds) - len(varBinds) % len(column_objects)]
+
+            if not varBinds:
+                break  # agent returned no complete rows, avoid looping forever
+
+            # The repeaters are row-major: one varbind per column for each repetition. A
+            # varbind outside its requested column means that column's walk ran past the
+            # table end (endOfMibView or a neighbouring subtree), so it contributes nothing.
+            appended = False
+            for row_start in range(0, len(varBinds), len(column_objects)):
+                for column, column_oid, varBind in zip(columns, column_oids,
+                                                       varBinds[row_start:row_start + len(column_objects)]):
+                    if len(column) < row_count and self._varbind_in_column(varBind, column_oid):
+                        value = self._parse_varbind(varBind)
+                        if value is None:
+                            continue  # exception sentinel; leave the column short like a table end
+                        column.append(value)
+                        appended = True
+
+            if not appended:
+                break  # every remaining column has walked past the table end
+
+            # Resume the walk from the last complete row received
+            column_objects = [ObjectType(ObjectIdentity(varBind[0].get_oid())) for varBind in
+                              varBinds[-len(column_objects):]]
+
+        return non_repeater_results, columns
+
+    @staticmethod
+    def _varbind_in_column(varBind, column_oid) -> bool:
+        if not isinstance(column_oid[0], int):
+            return True  # symbolic column spec, no numeric prefix to compare against
+        oid = tuple(varBind[0].get_oid())
+        return oid[:len(column_oid)] == tuple(column_oid)
+
+    @staticmethod
+    def _parse_varbind(varBind) -> any:
+        # Use the native value instead of re-parsing the pretty-printed "name = value" string;
+        # splitting on '=' misreads negative/float values and costs string work per OID
+        val = varBind[1]
+        if isinstance(val, (NoSuchObject, NoSuchInstance, EndOfMibView)):
+            # v2c exception sentinel: the instance does not exist on the agent. These arrive
+            # with errorStatus == noError, so they must be caught here, not by the error guards.
+            return None
+        if isinstance(val, OctetString):
+            return val.prettyPrint()  # DisplayString and friends decode to text
+        return int(val)